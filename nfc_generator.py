@@ -0,0 +1,399 @@
+#! /usr/bin/env python3
+
+"""
+Leif Gregory <leif@devtek.org>
+Synthetic NFC Card Generator
+Tested to Python v3.10.7
+
+Writes valid .nfc files in the same format Flipper Zero saves them so the
+decoders in this repo can be run against far more than a handful of sample
+cards. Covers MIFARE Classic Mini/1K/4K and NTAG213/215/216.
+
+Every card is generated from its own random.Random seeded with the global seed
+and the card number, so a given seed always produces the same corpus no matter
+how many processes are used or what order the chunks finish in.
+
+MIFARE Classic cards get a proper manufacturer block (UID, BCC, SAK, ATQA),
+sector trailers with valid access bytes (checksums pass m1k_access_rights.py),
+optional value blocks and '??' for unknown keys or sectors that weren't read.
+
+NTAG cards get a 7 byte UID with both BCC bytes, a capability container, an
+NDEF Text or URI record terminated by FE and the config pages.
+
+Output is sharded into sub-directories of --per-dir cards so millions of files
+don't end up in one directory. Each card is built in memory and written with a
+single buffered write.
+
+For more information on MIFARE Classic EV1 1K cards
+https://www.nxp.com/docs/en/data-sheet/MF1S50YYX_V1.pdf
+
+For more information on NTAG213/215/216
+https://www.nxp.com/docs/en/data-sheet/NTAG213_215_216.pdf
+
+Changelog
+20261019 -  Initial Code
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import argparse
+import os
+import random
+import re
+import time
+from multiprocessing import Pool
+from sys import exit
+
+# Type: (Flipper type name, sectors, SAK, ATQA as shown in the header)
+CLASSIC_TYPES = {"mini": ("MINI", 5, 0x09, "00 04"),
+                 "1k": ("1K", 16, 0x08, "00 04"),
+                 "4k": ("4K", 40, 0x18, "00 02")}
+
+# Type: (Flipper type name, total pages, version storage size, CC size byte)
+NTAG_TYPES = {"ntag213": ("NTAG213", 45, 0x0F, 0x12),
+              "ntag215": ("NTAG215", 135, 0x11, 0x3E),
+              "ntag216": ("NTAG216", 231, 0x13, 0x6D)}
+
+# Access bits (C1C2C3) for data blocks 0, 1, 2 and the sector trailer
+ACCESS_CONFIGS = {"transport": ("000", "000", "000", "001"),  # FF 07 80
+                  "key_b_rw": ("100", "100", "100", "011"),  # 78 77 88
+                  "value": ("110", "110", "110", "011"),
+                  "read_only": ("010", "010", "010", "110")}
+
+# Keys commonly found in the wild plus the factory default
+COMMON_KEYS = [bytes.fromhex(k) for k in ("FFFFFFFFFFFF", "A0A1A2A3A4A5",
+                                          "B0B1B2B3B4B5", "D3F7D3F7D3F7",
+                                          "000000000000", "4D3A99C351DD")]
+
+WORDS = ["access", "badge", "door", "lobby", "flipper", "zero", "parking",
+         "visitor", "employee", "hotel", "room", "gym", "locker", "transit"]
+
+UNKNOWN_BLOCK = " ".join(["??"] * 16)
+UNKNOWN_KEY = " ".join(["??"] * 6)
+
+
+def hexs(data):
+    """Formats bytes the way Flipper does i.e. 'DE AD BE EF'"""
+    return data.hex(" ").upper()
+
+
+def bcc(data):
+    """XOR of all bytes, used for the UID check bytes"""
+    check = 0
+    for byte in data:
+        check ^= byte
+    return check
+
+
+def encode_access_bits(c_bits):
+    """Builds access bytes 6, 7 and 8 of a sector trailer. This is the reverse
+    of hex2bin/validate_access_bits in m1k_access_rights.py.
+
+    Parameters
+    ----------
+    c_bits : tuple
+        C1C2C3 as a 3 char binary string for blocks 0, 1, 2 and the trailer
+
+    Returns
+    -------
+    bytes
+        The three access bytes including the inverted checksum nibbles
+    """
+
+    c1 = c2 = c3 = 0
+    for block, bits in enumerate(c_bits):
+        c1 |= int(bits[0]) << block
+        c2 |= int(bits[1]) << block
+        c3 |= int(bits[2]) << block
+
+    byte_6 = ((~c2 & 0x0F) << 4) | (~c1 & 0x0F)
+    byte_7 = (c1 << 4) | (~c3 & 0x0F)
+    byte_8 = (c3 << 4) | c2
+
+    return bytes((byte_6, byte_7, byte_8))
+
+
+# Trailer bytes 6-9 never change, so only work them out once
+ACCESS_NAMES = list(ACCESS_CONFIGS)
+ACCESS_BYTES = {k: encode_access_bits(v) + b"\x69" for k, v in ACCESS_CONFIGS.items()}
+
+
+def value_block(value, address):
+    """Builds a value block: value, inverted value, value, then the address
+    byte and its inverse twice. Value is a signed 4 byte little endian int."""
+    val = value.to_bytes(4, "little", signed=True)
+    inv = bytes(b ^ 0xFF for b in val)
+    return val + inv + val + bytes((address, address ^ 0xFF, address, address ^ 0xFF))
+
+
+def make_uid(rng, length, settings):
+    """Random UID honouring the user supplied prefix. NTAG (7 byte) UIDs start
+    with the NXP manufacturer code 04 unless a prefix says otherwise."""
+    prefix = settings["uid_prefix"]
+    if not prefix and length == 7:
+        prefix = b"\x04"
+    return prefix + rng.randbytes(length - len(prefix))
+
+
+def roll_bad_bcc(rng, settings):
+    """True for --bad-bcc percent of cards. Rolled once per card."""
+    return bool(settings["bad_bcc"]) and rng.random() < settings["bad_bcc"]
+
+
+def make_check(rng, data, corrupt=False):
+    """BCC for data, deliberately wrong if corrupt is set"""
+    check = bcc(data)
+    if corrupt:
+        check ^= rng.randint(1, 255)
+    return check
+
+
+def data_block(rng, kind, address):
+    """Contents of a single data block for the given sector kind"""
+    if kind == "value":
+        return value_block(rng.randint(-100000, 100000), address)
+    if kind == "text":
+        return rng.choice(WORDS).encode("ascii").ljust(16, b"\x00")[:16]
+    if kind == "random":
+        return rng.randbytes(16)
+    return bytes(16)
+
+
+def classic_card(rng, card_type, settings):
+    """Builds the full .nfc text for a MIFARE Classic card"""
+    name, sectors, sak, atqa = CLASSIC_TYPES[card_type]
+
+    uid = make_uid(rng, 4, settings)
+    atqa_bytes = bytes.fromhex(atqa)[::-1]  # Stored backwards in block 0
+    block_0 = uid + bytes((make_check(rng, uid, roll_bad_bcc(rng, settings)), sak)) + atqa_bytes + rng.randbytes(8)
+
+    lines = ["Filetype: Flipper NFC device",
+             "Version: 3",
+             "# Nfc device type can be UID, Mifare Ultralight, Mifare Classic",
+             "Device type: Mifare Classic",
+             "# UID, ATQA and SAK are common for all formats",
+             f"UID: {hexs(uid)}",
+             f"ATQA: {atqa}",
+             f"SAK: {sak:02X}",
+             "# Mifare Classic specific data",
+             f"Mifare Classic type: {name}",
+             "Data format version: 2",
+             "# Mifare Classic blocks, '??' means unknown data"]
+
+    block = 0
+    for sector in range(sectors):
+        blocks_in_sector = 4 if sector < 32 else 16  # 4K upper sectors are big
+
+        # Sector 0 always gets read, otherwise there would be no UID
+        if sector and rng.random() < settings["unknown_sectors"]:
+            for _ in range(blocks_in_sector):
+                lines.append(f"Block {block}: {UNKNOWN_BLOCK}")
+                block += 1
+            continue
+
+        access = rng.choices(ACCESS_NAMES, weights=(6, 2, 1, 1))[0]
+        if access == "value":
+            kind = "value"
+        else:
+            kind = rng.choices(("empty", "text", "random"), weights=(6, 1, 2))[0]
+
+        for offset in range(blocks_in_sector - 1):
+            if sector == 0 and offset == 0:
+                lines.append(f"Block {block}: {hexs(block_0)}")
+            else:
+                lines.append(f"Block {block}: {hexs(data_block(rng, kind, block & 0xFF))}")
+            block += 1
+
+        key_a = rng.choice(COMMON_KEYS) if rng.random() < 0.7 else rng.randbytes(6)
+        key_b = rng.choice(COMMON_KEYS) if rng.random() < 0.7 else rng.randbytes(6)
+        trailer = hexs(ACCESS_BYTES[access] + key_b)
+        if rng.random() < settings["unknown_keys"]:
+            lines.append(f"Block {block}: {UNKNOWN_KEY} {trailer}")
+        else:
+            lines.append(f"Block {block}: {hexs(key_a)} {trailer}")
+        block += 1
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def ndef_message(rng, capacity):
+    """NDEF TLV holding a single short Text or URI record, ends with FE"""
+    text = " ".join(rng.choices(WORDS, k=rng.randint(1, 6))).encode("ascii")
+    text = text[:capacity - 12]  # TLV, record header, language and FE
+
+    if rng.random() < 0.5:
+        payload = b"\x02en" + text  # UTF-8, 2 byte language code
+        record_type = b"T"
+    else:
+        payload = b"\x04" + text.replace(b" ", b"-") + b".example.com"  # https://
+        payload = payload[:capacity - 10]
+        record_type = b"U"
+
+    # MB, ME, SR, well known type
+    record = bytes((0xD1, len(record_type), len(payload))) + record_type + payload
+    return bytes((0x03, len(record))) + record + b"\xFE"
+
+
+def ntag_card(rng, card_type, settings):
+    """Builds the full .nfc text for an NTAG21x card"""
+    name, pages_total, storage_size, cc_size = NTAG_TYPES[card_type]
+
+    uid = make_uid(rng, 7, settings)
+    # Only one of the two BCCs is wrong on a bad card
+    corrupt = roll_bad_bcc(rng, settings)
+    corrupt_first = corrupt and rng.random() < 0.5
+    bcc_0 = make_check(rng, b"\x88" + uid[:3], corrupt_first)  # 88 is the cascade tag
+    bcc_1 = make_check(rng, uid[3:], corrupt and not corrupt_first)
+
+    user_bytes = (pages_total - 9) * 4  # Everything between CC and dynamic lock
+    memory = bytearray(user_bytes)
+    ndef = ndef_message(rng, user_bytes)
+    memory[:len(ndef)] = ndef
+
+    pages = [uid[:3] + bytes((bcc_0,)),
+             uid[3:],
+             bytes((bcc_1, 0x48, 0x00, 0x00)),
+             bytes((0xE1, 0x10, cc_size, 0x00))]
+    pages += [bytes(memory[i:i + 4]) for i in range(0, user_bytes, 4)]
+    pages += [bytes((0x00, 0x00, 0x00, 0xBD)),  # Dynamic lock
+              bytes((0x04, 0x00, 0x00, 0xFF)),  # CFG0, AUTH0 FF is no password
+              bytes((0x00, 0x05, 0x00, 0x00)),  # CFG1
+              bytes(4),  # PWD always reads back as zeros
+              bytes(4)]  # PACK
+
+    lines = ["Filetype: Flipper NFC device",
+             "Version: 3",
+             "# Nfc device type can be UID, Mifare Ultralight, Mifare Classic",
+             f"Device type: {name}",
+             "# UID, ATQA and SAK are common for all formats",
+             f"UID: {hexs(uid)}",
+             "ATQA: 00 44",
+             "SAK: 00",
+             "# Mifare Ultralight specific data",
+             "Data format version: 1",
+             f"Signature: {hexs(rng.randbytes(32))}",
+             f"Mifare version: 00 04 04 02 01 00 {storage_size:02X} 03"]
+
+    for counter in range(3):
+        lines.append(f"Counter {counter}: 0")
+        lines.append(f"Tearing {counter}: 00")
+
+    lines.append(f"Pages total: {pages_total}")
+    lines.append(f"Pages read: {pages_total}")
+    for page, data in enumerate(pages):
+        lines.append(f"Page {page}: {hexs(data)}")
+    lines.append("Failed authentication attempts: 0")
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_card(card_number, settings):
+    """Card number and seed fully determine the card"""
+    rng = random.Random(f"{settings['seed']}:{card_number}")  # Unique for any seed, even negative
+    card_type = rng.choice(settings["types"])
+
+    if card_type in CLASSIC_TYPES:
+        return card_type, classic_card(rng, card_type, settings)
+    return card_type, ntag_card(rng, card_type, settings)
+
+
+def generate_chunk(job):
+    """Pool worker. Writes one sub-directory worth of cards and returns how
+    many were written."""
+    chunk, start, count, settings = job
+
+    out_dir = os.path.join(settings["output"], f"{chunk:05d}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    for card_number in range(start, start + count):
+        card_type, card = generate_card(card_number, settings)
+        filename = os.path.join(out_dir, f"{card_number:08d}_{card_type}.nfc")
+        with open(filename, "w", buffering=len(card) + 1, newline="\n") as fh:
+            fh.write(card)
+
+    return count
+
+
+def main():
+    all_types = list(CLASSIC_TYPES) + list(NTAG_TYPES)
+
+    parser = argparse.ArgumentParser(description='Synthetic NFC Card Generator')
+    parser.add_argument('-n', type=int, default=1000, help='Number of cards to generate (default 1000)', dest='count')
+    parser.add_argument('-o', type=str, default='generated_cards', help='Output directory (default generated_cards)', dest='output')
+    parser.add_argument('-t', type=str, nargs='+', choices=all_types, default=all_types, help='Card types to generate (default all)', dest='types')
+    parser.add_argument('-s', type=int, default=0, help='Random seed (default 0)', dest='seed')
+    parser.add_argument('-p', type=int, default=os.cpu_count() or 1, help='Processes to use (default CPU count)', dest='processes')
+    parser.add_argument('--per-dir', type=int, default=1000, help='Cards per sub-directory (default 1000)', dest='per_dir')
+    parser.add_argument('--uid-prefix', type=str, default='', help='Fixed leading UID bytes in hex (like 04A1). Up to 3 bytes with Classic types, 6 with NTAG only', dest='uid_prefix')
+    parser.add_argument('--bad-bcc', type=float, default=0.0, help='Fraction of cards with a wrong BCC (default 0)', dest='bad_bcc')
+    parser.add_argument('--unknown-keys', type=float, default=0.5, help='Fraction of sectors with Key A shown as ?? (default 0.5)', dest='unknown_keys')
+    parser.add_argument('--unknown-sectors', type=float, default=0.1, help='Fraction of sectors not read at all (default 0.1)', dest='unknown_sectors')
+    parser.add_argument('--force', action='store_true', help='Write into a non-empty output directory anyway', dest='force')
+    parser.add_argument('-v', action='version', version='%(prog)s 0.1', dest='version')
+    args = parser.parse_args()
+
+    # Sanity checking
+    if args.count < 1 or args.per_dir < 1 or args.processes < 1:
+        print("ERROR: -n, -p and --per-dir must be at least 1")
+        exit(1)
+    uid_prefix = args.uid_prefix.replace(' ', '')  # Allow '04 A1' as well as '04A1'
+    if uid_prefix and not re.search('^([A-Fa-f0-9]{2}){1,7}$', uid_prefix):
+        print("ERROR: Invalid UID prefix. A valid entry would look like 04A1")
+        exit(1)
+    # Leave at least one random byte or every card gets the same UID
+    uid_length = 4 if any(t in CLASSIC_TYPES for t in args.types) else 7
+    if len(uid_prefix) // 2 >= uid_length:
+        print(f"ERROR: UID prefix must be shorter than {uid_length} bytes for the selected card types")
+        exit(1)
+    for fraction in (args.bad_bcc, args.unknown_keys, args.unknown_sectors):
+        if not 0 <= fraction <= 1:
+            print("ERROR: --bad-bcc, --unknown-keys and --unknown-sectors must be between 0 and 1")
+            exit(1)
+    if os.path.exists(args.output) and not os.path.isdir(args.output):
+        print(f"ERROR: {args.output} exists and is not a directory")
+        exit(1)
+    # Old cards from another seed or type mix would end up in the corpus
+    if os.path.isdir(args.output) and os.listdir(args.output) and not args.force:
+        print(f"ERROR: {args.output} is not empty. Use a new directory or --force")
+        exit(1)
+
+    # Plain dict so it pickles cheaply into the worker processes
+    settings = {"seed": args.seed,
+                "types": sorted(set(args.types), key=all_types.index),
+                "output": args.output,
+                "uid_prefix": bytes.fromhex(uid_prefix),
+                "bad_bcc": args.bad_bcc,
+                "unknown_keys": args.unknown_keys,
+                "unknown_sectors": args.unknown_sectors}
+
+    jobs = [(chunk, start, min(args.per_dir, args.count - start), settings)
+            for chunk, start in enumerate(range(0, args.count, args.per_dir))]
+
+    started = time.perf_counter()
+    written = 0
+    if args.processes == 1:
+        for job in jobs:
+            written += generate_chunk(job)
+    else:
+        with Pool(args.processes) as pool:
+            for count in pool.imap_unordered(generate_chunk, jobs):
+                written += count
+
+    elapsed = time.perf_counter() - started
+    print(f"{written} cards written to {args.output} in {elapsed:.2f}s ({written / elapsed:,.0f} cards/s)")
+
+
+if __name__ == '__main__':
+    main()